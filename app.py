@@ -4,18 +4,13 @@ A comprehensive AI-powered resume analysis platform built with Streamlit.
 """
 
 import streamlit as st
-import sys
-import os
-
-# Add utils to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
+import hashlib
 
 from utils.ui_components import (
-    load_custom_css, create_feature_card, create_alert,
+    load_custom_css, feature_card_html, create_alert,
     initialize_session_state, create_sidebar_navigation
 )
-from utils.gemini_client import get_gemini_client
-from utils.resume_parser import parse_uploaded_resume
+from utils.gemini_client import get_gemini_client, is_gemini_configured
 
 # Page configuration
 st.set_page_config(
@@ -25,6 +20,120 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Feature overview cards as (icon, title, description)
+FEATURES = (
+    ("📊", "📊 ATS Score Checker",
+     "Get comprehensive ATS compatibility scores with detailed recommendations for improvement."),
+    ("🎯", "🎯 Job Matcher",
+     "Match your resume against job descriptions and identify skill gaps with precision."),
+    ("📈", "📈 Analytics Dashboard",
+     "Track your resume improvement over time with detailed analytics and insights."),
+    ("📝", "📝 Resume Builder",
+     "Create professional resumes using AI-powered templates and optimization."),
+    ("💬", "💬 Feedback System",
+     "Provide feedback to help us improve the platform and your experience."),
+    ("🚀", "🚀 Quick Analysis",
+     "Upload your resume below for instant analysis and get started immediately."),
+)
+
+@st.cache_data
+def _render_feature_grid(features: tuple) -> str:
+    """Build the whole feature card grid as one HTML string."""
+    cards = "".join(feature_card_html(title, description, icon)
+                    for icon, title, description in features)
+    return f'<div class="feature-grid">{cards}</div>'
+
+GETTING_STARTED_MD = """
+### How to Use Resume Analyzer Pro
+
+1. **Upload Your Resume** 📄
+   - Supported formats: PDF, DOCX, TXT
+   - Maximum file size: 10MB
+   - Ensure your resume is clearly formatted
+
+2. **Get Instant Analysis** ⚡
+   - Basic information extraction
+   - Text parsing and validation
+   - File metadata analysis
+
+3. **AI-Powered Insights** 🤖
+   - Detailed resume structure analysis
+   - Skills and experience extraction
+   - Professional recommendations
+
+4. **Advanced Features** 🎯
+   - ATS compatibility scoring
+   - Job description matching
+   - Resume improvement suggestions
+   - Performance analytics
+
+5. **Track Progress** 📈
+   - Monitor improvement over time
+   - Compare different versions
+   - Export analysis results
+"""
+
+FOOTER_HTML = (
+    '<div class="app-footer">'
+    '<div><strong>🎯 Resume Analyzer Pro</strong><br>AI-powered career optimization</div>'
+    '<div><strong>🔧 Features</strong><br>ATS scoring, job matching, analytics</div>'
+    '<div><strong>🚀 Get Started</strong><br>Upload your resume above</div>'
+    '</div>'
+)
+
+@st.cache_resource
+def _client():
+    """Build the Gemini client once per process and share it across sessions."""
+    return get_gemini_client()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_parse(file_hash: str, filename: str, _path: str):
+    """
+    Parse a stored upload once per file hash; reruns hit the cache.
+    The stored path is unique per write, so it is left out of the cache key.
+    """
+    from utils.resume_parser import parse_uploaded_resume_from_path
+    # The landing page only displays the first contact match of each kind
+    return parse_uploaded_resume_from_path(_path, filename, quick=True)
+
+def _parse_upload(uploaded_file):
+    """
+    Hash the upload and parse it if it has not been parsed yet.
+
+    Returns:
+        Tuple of (file_hash, parsed); parsed is None when session state
+        already holds the parse result for this file
+    """
+    # UploadedFile is a BytesIO; hash a zero-copy view instead of a getvalue() copy
+    with uploaded_file.getbuffer() as file_view:
+        file_hash = hashlib.blake2b(file_view, digest_size=16).hexdigest()
+
+        if (st.session_state.get('last_hash') == file_hash
+                and st.session_state.get('current_resume_text')):
+            return file_hash, None
+
+        from utils.resume_parser import validate_upload, store_upload, discard_upload
+
+        # Reject oversized or unsupported files before anything is written to disk
+        is_valid, error_msg = validate_upload(uploaded_file)
+        if not is_valid:
+            st.error(f"❌ {error_msg}")
+            return file_hash, (None, None, None)
+
+        resume_path = store_upload(file_view, uploaded_file.name)
+
+    try:
+        return file_hash, _cached_parse(file_hash, uploaded_file.name, resume_path)
+    finally:
+        # The parse result is cached, so the stored copy is only needed while parsing
+        discard_upload(resume_path)
+
+def _set_if_changed(key: str, value) -> None:
+    """Write a session state key only when its value actually changed."""
+    current = st.session_state.get(key)
+    if current is not value and current != value:
+        st.session_state[key] = value
+
 def main():
     """Main application function."""
 
@@ -39,9 +148,12 @@ def main():
     st.title("🎯 AI-Powered Resume Analyzer Pro")
     st.markdown("### Transform your resume with intelligent analysis and optimization")
 
-    # Check AI availability
-    gemini_client = get_gemini_client()
-    if not gemini_client.is_available():
+    # Check AI availability; the client (and the SDK) is only built on Analyze
+    if '_gemini_available' not in st.session_state:
+        st.session_state['_gemini_available'] = is_gemini_configured()
+    ai_available = st.session_state['_gemini_available']
+
+    if not ai_available:
         create_alert(
             "⚠️ AI features are currently unavailable. Please configure your Google API key in Streamlit secrets to enable full functionality.",
             "warning"
@@ -50,51 +162,7 @@ def main():
 
     # Hero section with feature overview
     st.markdown("---")
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        create_feature_card(
-            "📊 ATS Score Checker",
-            "Get comprehensive ATS compatibility scores with detailed recommendations for improvement.",
-            "📊"
-        )
-
-    with col2:
-        create_feature_card(
-            "🎯 Job Matcher", 
-            "Match your resume against job descriptions and identify skill gaps with precision.",
-            "🎯"
-        )
-
-    with col3:
-        create_feature_card(
-            "📈 Analytics Dashboard",
-            "Track your resume improvement over time with detailed analytics and insights.",
-            "📈"
-        )
-
-    col4, col5, col6 = st.columns(3)
-
-    with col4:
-        create_feature_card(
-            "📝 Resume Builder",
-            "Create professional resumes using AI-powered templates and optimization.",
-            "📝"
-        )
-
-    with col5:
-        create_feature_card(
-            "💬 Feedback System",
-            "Provide feedback to help us improve the platform and your experience.",
-            "💬"
-        )
-
-    with col6:
-        create_feature_card(
-            "🚀 Quick Analysis",
-            "Upload your resume below for instant analysis and get started immediately.",
-            "🚀"
-        )
+    st.markdown(_render_feature_grid(FEATURES), unsafe_allow_html=True)
 
     # Quick Analysis Section
     st.markdown("---")
@@ -109,15 +177,30 @@ def main():
     )
 
     if uploaded_file is not None:
-        # Parse the resume
+        # Parse the resume only when the uploaded bytes change
         with st.spinner("📄 Processing your resume..."):
-            text_content, metadata, basic_info = parse_uploaded_resume(uploaded_file)
+            file_hash, parsed = _parse_upload(uploaded_file)
+
+        if parsed is None:
+            text_content = st.session_state['current_resume_text']
+            metadata = st.session_state['current_resume_metadata']
+            basic_info = st.session_state['current_resume_basic_info']
+        else:
+            text_content, metadata, basic_info = parsed
+
+            if text_content:
+                # Only the short preview is ever sent to the browser
+                st.session_state['preview_text'] = (
+                    text_content[:1000] + "..." if len(text_content) > 1000 else text_content
+                )
 
         if text_content:
-            # Store in session state
-            st.session_state['current_resume_text'] = text_content
-            st.session_state['current_resume_metadata'] = metadata
-            st.session_state['current_resume_basic_info'] = basic_info
+            # Store in session state; an unchanged file hash means it is already there
+            if parsed is not None:
+                st.session_state['current_resume_text'] = text_content
+                st.session_state['current_resume_metadata'] = metadata
+                st.session_state['current_resume_basic_info'] = basic_info
+                st.session_state['last_hash'] = file_hash
 
             # Display success message
             create_alert("✅ Resume processed successfully! You can now use all analysis features.", "success")
@@ -145,25 +228,39 @@ def main():
                     if basic_info['urls']:
                         st.write(f"**URLs Found:** {len(basic_info['urls'])}")
 
-            # Preview text content
-            with st.expander("📖 Preview Resume Content"):
-                preview_text = text_content[:1000] + "..." if len(text_content) > 1000 else text_content
-                st.text_area("Resume Content Preview", preview_text, height=200, disabled=True)
+            # Preview text content, rendered only on request
+            if st.toggle("📖 Preview Resume Content", key='show_preview'):
+                st.text_area(
+                    "Resume Content Preview",
+                    st.session_state.get('preview_text', ''),
+                    height=200,
+                    disabled=True
+                )
 
             # Quick AI Analysis (if available)
-            if gemini_client.is_available():
+            if ai_available:
                 st.markdown("---")
                 st.subheader("🤖 Quick AI Analysis")
 
                 if st.button("🔍 Analyze with AI", type="primary"):
-                    with st.spinner("🤖 AI is analyzing your resume..."):
-                        analysis_result = gemini_client.analyze_resume(text_content)
+                    # Stream the response so output shows up from the first token
+                    status_placeholder = st.empty()
+                    stream_placeholder = st.empty()
+                    status_placeholder.caption("🤖 AI is analyzing your resume...")
+
+                    analysis_result = _client().analyze_resume(
+                        text_content,
+                        on_chunk=lambda partial: stream_placeholder.code(partial, language="json")
+                    )
+
+                    status_placeholder.empty()
+                    stream_placeholder.empty()
 
                     if analysis_result:
                         st.success("✅ AI analysis completed!")
 
                         # Store analysis result
-                        st.session_state['current_resume_data'] = analysis_result
+                        _set_if_changed('current_resume_data', analysis_result)
 
                         # Display key insights
                         col1, col2 = st.columns(2)
@@ -193,16 +290,13 @@ def main():
                         col1, col2, col3 = st.columns(3)
 
                         with col1:
-                            if st.button("📊 Get ATS Score", type="secondary"):
-                                st.switch_page("pages/1_📊_ATS_Score_Checker.py")
+                            st.page_link("pages/1_📊_ATS_Score_Checker.py", label="📊 Get ATS Score")
 
                         with col2:
-                            if st.button("🎯 Match Jobs", type="secondary"):
-                                st.switch_page("pages/2_🎯_Job_Matcher.py")
+                            st.page_link("pages/2_🎯_Job_Matcher.py", label="🎯 Match Jobs")
 
                         with col3:
-                            if st.button("📈 View Analytics", type="secondary"):
-                                st.switch_page("pages/3_📈_Analytics_Dashboard.py")
+                            st.page_link("pages/3_📈_Analytics_Dashboard.py", label="📈 View Analytics")
 
             else:
                 st.info("🤖 AI analysis unavailable. Please configure Google API key for full features.")
@@ -214,65 +308,21 @@ def main():
                 col1, col2 = st.columns(2)
 
                 with col1:
-                    if st.button("📊 Basic ATS Check", type="secondary"):
-                        st.switch_page("pages/1_📊_ATS_Score_Checker.py")
+                    st.page_link("pages/1_📊_ATS_Score_Checker.py", label="📊 Basic ATS Check")
 
                 with col2:
-                    if st.button("📈 View Analytics", type="secondary"):
-                        st.switch_page("pages/3_📈_Analytics_Dashboard.py")
+                    st.page_link("pages/3_📈_Analytics_Dashboard.py", label="📈 View Analytics")
 
     else:
         # Show getting started information
         st.markdown("---")
         st.subheader("🚀 Getting Started")
 
-        getting_started_info = """
-        ### How to Use Resume Analyzer Pro
-
-        1. **Upload Your Resume** 📄
-           - Supported formats: PDF, DOCX, TXT
-           - Maximum file size: 10MB
-           - Ensure your resume is clearly formatted
-
-        2. **Get Instant Analysis** ⚡
-           - Basic information extraction
-           - Text parsing and validation
-           - File metadata analysis
-
-        3. **AI-Powered Insights** 🤖
-           - Detailed resume structure analysis
-           - Skills and experience extraction
-           - Professional recommendations
-
-        4. **Advanced Features** 🎯
-           - ATS compatibility scoring
-           - Job description matching
-           - Resume improvement suggestions
-           - Performance analytics
-
-        5. **Track Progress** 📈
-           - Monitor improvement over time
-           - Compare different versions
-           - Export analysis results
-        """
-
-        st.markdown(getting_started_info)
+        st.markdown(GETTING_STARTED_MD)
 
     # Footer
     st.markdown("---")
-    footer_col1, footer_col2, footer_col3 = st.columns(3)
-
-    with footer_col1:
-        st.caption("🎯 **Resume Analyzer Pro**")
-        st.caption("AI-powered career optimization")
-
-    with footer_col2:
-        st.caption("🔧 **Features**")
-        st.caption("ATS scoring, job matching, analytics")
-
-    with footer_col3:
-        st.caption("🚀 **Get Started**")
-        st.caption("Upload your resume above")
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
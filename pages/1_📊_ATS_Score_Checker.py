@@ -4,20 +4,17 @@ Comprehensive ATS compatibility analysis with detailed scoring and recommendatio
 """
 
 import streamlit as st
-import sys
-import os
 import json
-from typing import Dict, Any, List
-
-# Add utils to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+import hashlib
+from collections import deque
+from typing import Dict, Any
 
 from utils.ui_components import (
     load_custom_css, create_score_badge, create_alert,
-    create_progress_bar, create_recommendation_list, create_metric_card
+    create_progress_bars, create_recommendation_list, create_metric_card,
+    score_band, ANALYSIS_HISTORY_SIZE
 )
-from utils.gemini_client import get_gemini_client
-from utils.resume_parser import parse_uploaded_resume
+from utils.ats_checker import ATSChecker
 
 # Page configuration
 st.set_page_config(
@@ -26,219 +23,111 @@ st.set_page_config(
     layout="wide"
 )
 
-class ATSChecker:
-    """ATS compatibility checker with rule-based and AI-powered analysis."""
-
-    def __init__(self):
-        self.scoring_weights = {
-            'format_compatibility': 20,
-            'content_structure': 25,
-            'keyword_optimization': 20,
-            'readability': 15,
-            'contact_information': 10,
-            'professional_sections': 10
-        }
-
-    def analyze_format_compatibility(self, text: str, metadata: Dict) -> Dict[str, Any]:
-        """Analyze format compatibility for ATS systems."""
-        score = 100
-        issues = []
-        recommendations = []
-
-        # Check text extraction quality
-        if not text or len(text.strip()) < 100:
-            score -= 30
-            issues.append("Poor text extraction - file may have formatting issues")
-            recommendations.append("Convert to a text-based PDF or DOCX format")
-
-        # Check file type
-        file_type = metadata.get('file_type', '').lower()
-        if file_type not in ['pdf', 'docx']:
-            score -= 20
-            issues.append(f"File format ({file_type}) may not be ATS-friendly")
-            recommendations.append("Use PDF or DOCX format for better ATS compatibility")
-
-        # Check for special characters
-        special_chars = len([c for c in text if ord(c) > 127])
-        if special_chars > len(text) * 0.05:  # More than 5% special characters
-            score -= 15
-            issues.append("High number of special characters detected")
-            recommendations.append("Remove or replace special characters and symbols")
-
-        return {
-            'score': max(0, score),
-            'issues': issues,
-            'recommendations': recommendations
-        }
-
-    def analyze_content_structure(self, text: str) -> Dict[str, Any]:
-        """Analyze content structure and organization."""
-        score = 100
-        issues = []
-        recommendations = []
-
-        # Check for standard resume sections
-        required_sections = [
-            ('contact', ['email', 'phone', 'address']),
-            ('experience', ['experience', 'work', 'employment', 'professional']),
-            ('education', ['education', 'degree', 'university', 'college']),
-            ('skills', ['skills', 'technical', 'competencies'])
-        ]
-
-        text_lower = text.lower()
-        missing_sections = []
-
-        for section_name, keywords in required_sections:
-            found = any(keyword in text_lower for keyword in keywords)
-            if not found:
-                missing_sections.append(section_name)
-                score -= 15
-                issues.append(f"Missing {section_name} section")
-                recommendations.append(f"Add a clear {section_name.title()} section")
-
-        # Check text length
-        word_count = len(text.split())
-        if word_count < 200:
-            score -= 20
-            issues.append("Resume content too brief")
-            recommendations.append("Expand resume content to 300-800 words")
-        elif word_count > 1000:
-            score -= 10
-            issues.append("Resume content too lengthy")
-            recommendations.append("Condense content to focus on most relevant information")
-
-        return {
-            'score': max(0, score),
-            'issues': issues,
-            'recommendations': recommendations,
-            'missing_sections': missing_sections
-        }
-
-    def analyze_keyword_optimization(self, text: str, job_description: str = "") -> Dict[str, Any]:
-        """Analyze keyword optimization and density."""
-        score = 100
-        issues = []
-        recommendations = []
-        keywords_found = []
-
-        # Common professional keywords
-        professional_keywords = [
-            'managed', 'developed', 'created', 'implemented', 'improved',
-            'increased', 'reduced', 'achieved', 'delivered', 'coordinated',
-            'led', 'supervised', 'analyzed', 'designed', 'optimized'
-        ]
-
-        text_lower = text.lower()
-        found_keywords = [kw for kw in professional_keywords if kw in text_lower]
-        keywords_found.extend(found_keywords)
-
-        if len(found_keywords) < 5:
-            score -= 25
-            issues.append("Insufficient action verbs and professional keywords")
-            recommendations.append("Include more action verbs and industry-specific keywords")
-
-        # Check for quantified achievements
-        import re
-        numbers = re.findall(r'\b\d+%|\$\d+|\d+\+|\d+ years?|\d+ months?', text)
-        if len(numbers) < 3:
-            score -= 20
-            issues.append("Few quantified achievements found")
-            recommendations.append("Add specific numbers, percentages, and metrics to achievements")
-
-        # Job description matching (if provided)
-        if job_description:
-            jd_words = set(job_description.lower().split())
-            resume_words = set(text_lower.split())
-            common_words = jd_words.intersection(resume_words)
-            match_ratio = len(common_words) / len(jd_words) if jd_words else 0
-
-            if match_ratio < 0.3:
-                score -= 15
-                issues.append("Low keyword match with job description")
-                recommendations.append("Tailor resume keywords to match job requirements")
-
-        return {
-            'score': max(0, score),
-            'issues': issues,
-            'recommendations': recommendations,
-            'keywords_found': keywords_found[:10]  # Return top 10
-        }
-
-    def analyze_readability(self, text: str) -> Dict[str, Any]:
-        """Analyze text readability and formatting."""
-        score = 100
-        issues = []
-        recommendations = []
-
-        # Check sentence length
-        sentences = text.split('.')
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0
-
-        if avg_sentence_length > 25:
-            score -= 15
-            issues.append("Sentences too long for ATS parsing")
-            recommendations.append("Use shorter, clearer sentences (15-20 words)")
-
-        # Check for bullet points or structured formatting
-        bullet_indicators = ['•', '★', '-', '*', '◦']
-        has_bullets = any(indicator in text for indicator in bullet_indicators)
-
-        if not has_bullets:
-            score -= 10
-            issues.append("No bullet points detected")
-            recommendations.append("Use bullet points to structure information clearly")
-
-        # Check for excessive capitalization
-        caps_ratio = sum(1 for c in text if c.isupper()) / len(text) if text else 0
-        if caps_ratio > 0.15:
-            score -= 15
-            issues.append("Excessive use of capital letters")
-            recommendations.append("Use proper capitalization (title case for headers)")
-
-        return {
-            'score': max(0, score),
-            'issues': issues,
-            'recommendations': recommendations
-        }
-
-    def analyze_contact_information(self, basic_info: Dict) -> Dict[str, Any]:
-        """Analyze contact information completeness."""
-        score = 100
-        issues = []
-        recommendations = []
-
-        if not basic_info.get('emails'):
-            score -= 40
-            issues.append("No email address found")
-            recommendations.append("Include a professional email address")
-
-        if not basic_info.get('phones'):
-            score -= 30
-            issues.append("No phone number found")
-            recommendations.append("Include a valid phone number")
-
-        if not basic_info.get('name_candidates'):
-            score -= 30
-            issues.append("Name not clearly identified")
-            recommendations.append("Ensure your full name is prominently displayed")
-
-        return {
-            'score': max(0, score),
-            'issues': issues,
-            'recommendations': recommendations
-        }
-
-    def calculate_overall_score(self, component_scores: Dict[str, int]) -> int:
-        """Calculate weighted overall ATS score."""
-        total_score = 0
-        total_weight = 0
-
-        for component, score in component_scores.items():
-            weight = self.scoring_weights.get(component, 10)
-            total_score += score * weight
-            total_weight += weight
+# Overall status label and alert type for each score band
+SCORE_STATUS = (
+    ("Poor ❌", "error"),
+    ("Needs Improvement ⚠️", "warning"),
+    ("Good 👍", "info"),
+    ("Excellent ✅", "success")
+)
 
-        return int(total_score / total_weight) if total_weight > 0 else 0
+# Number of (resume, job description) analyses kept per session
+ATS_CACHE_SIZE = 8
+
+def get_resume_key(resume_text: str) -> str:
+    """Identify the current resume by the upload's file hash, else by a digest of the text."""
+    return st.session_state.get('last_hash') or hashlib.blake2b(
+        resume_text.encode('utf-8'), digest_size=16
+    ).hexdigest()
+
+def get_resume_text_stats(ats_checker: ATSChecker, resume_text: str) -> Dict[str, Any]:
+    """Return text statistics for the current resume, computed once per upload."""
+    resume_key = get_resume_key(resume_text)
+
+    cached = st.session_state.get('_resume_stats')
+    if not cached or cached[0] != resume_key:
+        cached = (resume_key, ats_checker.compute_text_stats(resume_text))
+        st.session_state['_resume_stats'] = cached
+
+    return cached[1]
+
+def run_ats_analysis(ats_checker: ATSChecker, resume_text: str, metadata: Dict,
+                     basic_info: Dict, job_description: str) -> Dict[str, Any]:
+    """Run the rule-based and AI analyses and combine their findings."""
+
+    # Perform all analyses over one shared set of text statistics
+    text_stats = get_resume_text_stats(ats_checker, resume_text)
+    format_analysis = ats_checker.analyze_format_compatibility(resume_text, metadata, text_stats)
+    structure_analysis = ats_checker.analyze_content_structure(resume_text, text_stats)
+    keyword_analysis = ats_checker.analyze_keyword_optimization(resume_text, job_description, text_stats)
+    readability_analysis = ats_checker.analyze_readability(resume_text, text_stats)
+    contact_analysis = ats_checker.analyze_contact_information(basic_info)
+
+    # Calculate component scores
+    component_scores = {
+        'format_compatibility': format_analysis['score'],
+        'content_structure': structure_analysis['score'],
+        'keyword_optimization': keyword_analysis['score'],
+        'readability': readability_analysis['score'],
+        'contact_information': contact_analysis['score']
+    }
+
+    # Calculate overall score
+    overall_score = ats_checker.calculate_overall_score(component_scores)
+
+    # AI Enhancement (if available); the Gemini SDK is only imported once an analysis runs
+    from utils.gemini_client import get_gemini_client
+
+    gemini_client = get_gemini_client()
+    ai_analysis = None
+
+    if gemini_client.is_available():
+        with st.spinner("🤖 Getting AI insights..."):
+            ai_analysis = gemini_client.check_ats_compatibility(resume_text)
+
+    # Combine all issues and recommendations
+    all_issues = []
+    all_recommendations = []
+
+    for analysis in [format_analysis, structure_analysis, keyword_analysis, 
+                    readability_analysis, contact_analysis]:
+        all_issues.extend(analysis.get('issues', []))
+        all_recommendations.extend(analysis.get('recommendations', []))
+
+    # Add AI insights if available
+    if ai_analysis:
+        if ai_analysis.get('issues'):
+            all_issues.extend([issue.get('issue', '') for issue in ai_analysis['issues']])
+        if ai_analysis.get('recommendations'):
+            all_recommendations.extend(ai_analysis['recommendations'])
+
+    # Drop repeated findings while keeping their first-seen order
+    all_issues = list(dict.fromkeys(map(str, all_issues)))
+    all_recommendations = list(dict.fromkeys(map(str, all_recommendations)))
+
+    export_data = {
+        'overall_score': overall_score,
+        'component_scores': component_scores,
+        'issues': all_issues,
+        'recommendations': all_recommendations,
+        'keywords_found': keyword_analysis.get('keywords_found', []),
+        'ai_analysis': ai_analysis
+    }
+
+    return {
+        'format_analysis': format_analysis,
+        'structure_analysis': structure_analysis,
+        'keyword_analysis': keyword_analysis,
+        'readability_analysis': readability_analysis,
+        'contact_analysis': contact_analysis,
+        'component_scores': component_scores,
+        'overall_score': overall_score,
+        'ai_analysis': ai_analysis,
+        'all_issues': all_issues,
+        'all_recommendations': all_recommendations,
+        # Encoded once so the download button does not re-encode it on every rerun
+        'export_json': json.dumps(export_data, indent=2).encode('utf-8')
+    }
 
 def main():
     """Main function for ATS Score Checker page."""
@@ -279,37 +168,49 @@ def main():
         placeholder="Paste job description here for more accurate keyword matching..."
     )
 
+    # Analyses are memoized per (resume, job description) for this session
+    analysis_key = (
+        get_resume_key(resume_text),
+        hashlib.blake2b(job_description.encode('utf-8'), digest_size=16).hexdigest()
+    )
+    ats_cache = st.session_state.setdefault('_ats_cache', {})
+
     # Analysis button
-    if st.button("🔍 Analyze ATS Compatibility", type="primary"):
+    if st.button("🔍 Analyze ATS Compatibility", type="primary") and analysis_key not in ats_cache:
 
         with st.spinner("📊 Analyzing ATS compatibility..."):
+            results = run_ats_analysis(ats_checker, resume_text, metadata, basic_info, job_description)
 
-            # Perform all analyses
-            format_analysis = ats_checker.analyze_format_compatibility(resume_text, metadata)
-            structure_analysis = ats_checker.analyze_content_structure(resume_text)
-            keyword_analysis = ats_checker.analyze_keyword_optimization(resume_text, job_description)
-            readability_analysis = ats_checker.analyze_readability(resume_text)
-            contact_analysis = ats_checker.analyze_contact_information(basic_info)
-
-            # Calculate component scores
-            component_scores = {
-                'format_compatibility': format_analysis['score'],
-                'content_structure': structure_analysis['score'],
-                'keyword_optimization': keyword_analysis['score'],
-                'readability': readability_analysis['score'],
-                'contact_information': contact_analysis['score']
-            }
-
-            # Calculate overall score
-            overall_score = ats_checker.calculate_overall_score(component_scores)
-
-            # AI Enhancement (if available)
-            gemini_client = get_gemini_client()
-            ai_analysis = None
-
-            if gemini_client.is_available():
-                with st.spinner("🤖 Getting AI insights..."):
-                    ai_analysis = gemini_client.check_ats_compatibility(resume_text)
+        ats_cache[analysis_key] = results
+        while len(ats_cache) > ATS_CACHE_SIZE:
+            ats_cache.pop(next(iter(ats_cache)))
+
+        # Save analysis to history
+        analysis_result = {
+            'timestamp': st.session_state.get('analysis_timestamp', ''),
+            'overall_score': results['overall_score'],
+            'component_scores': results['component_scores'],
+            'issues_count': len(results['all_issues']),
+            'recommendations_count': len(results['all_recommendations'])
+        }
+
+        # Bounded history: the oldest records drop off once it is full
+        st.session_state.setdefault(
+            'analysis_history', deque(maxlen=ANALYSIS_HISTORY_SIZE)
+        ).append(analysis_result)
+
+    # Results stay visible across reruns for the analyzed resume and job description
+    results = ats_cache.get(analysis_key)
+    if results:
+        format_analysis = results['format_analysis']
+        structure_analysis = results['structure_analysis']
+        keyword_analysis = results['keyword_analysis']
+        readability_analysis = results['readability_analysis']
+        contact_analysis = results['contact_analysis']
+        overall_score = results['overall_score']
+        ai_analysis = results['ai_analysis']
+        all_issues = results['all_issues']
+        all_recommendations = results['all_recommendations']
 
         # Display Results
         st.markdown("---")
@@ -322,18 +223,7 @@ def main():
             create_score_badge(overall_score, "Overall ATS Score")
 
         with col2:
-            if overall_score >= 85:
-                status = "Excellent ✅"
-                color = "success"
-            elif overall_score >= 70:
-                status = "Good 👍"
-                color = "info"
-            elif overall_score >= 50:
-                status = "Needs Improvement ⚠️"
-                color = "warning"
-            else:
-                status = "Poor ❌"
-                color = "error"
+            status, color = SCORE_STATUS[score_band(overall_score)]
 
             create_alert(f"Status: {status}", color)
 
@@ -363,39 +253,26 @@ def main():
         # Progress bars for visual representation
         st.subheader("🎯 Score Visualization")
 
-        create_progress_bar(format_analysis['score'], 100, "Format Compatibility")
-        create_progress_bar(structure_analysis['score'], 100, "Content Structure")
-        create_progress_bar(keyword_analysis['score'], 100, "Keyword Optimization")
-        create_progress_bar(readability_analysis['score'], 100, "Readability")
-        create_progress_bar(contact_analysis['score'], 100, "Contact Information")
+        create_progress_bars({
+            "Format Compatibility": format_analysis['score'],
+            "Content Structure": structure_analysis['score'],
+            "Keyword Optimization": keyword_analysis['score'],
+            "Readability": readability_analysis['score'],
+            "Contact Information": contact_analysis['score']
+        })
 
         # Detailed Issues and Recommendations
         st.markdown("---")
         st.header("🔧 Detailed Analysis & Recommendations")
 
-        # Combine all issues and recommendations
-        all_issues = []
-        all_recommendations = []
-
-        for analysis in [format_analysis, structure_analysis, keyword_analysis, 
-                        readability_analysis, contact_analysis]:
-            all_issues.extend(analysis.get('issues', []))
-            all_recommendations.extend(analysis.get('recommendations', []))
-
-        # Add AI insights if available
-        if ai_analysis:
-            if ai_analysis.get('issues'):
-                all_issues.extend([issue.get('issue', '') for issue in ai_analysis['issues']])
-            if ai_analysis.get('recommendations'):
-                all_recommendations.extend(ai_analysis['recommendations'])
-
         col1, col2 = st.columns(2)
 
         with col1:
             if all_issues:
                 st.subheader("⚠️ Issues Found")
-                for i, issue in enumerate(all_issues, 1):
-                    st.write(f"{i}. {issue}")
+                st.markdown("\n".join(
+                    f"{i}. {issue}" for i, issue in enumerate(all_issues, 1)
+                ))
             else:
                 create_alert("✅ No major issues found!", "success")
 
@@ -412,22 +289,9 @@ def main():
         # AI Strengths (if available)
         if ai_analysis and ai_analysis.get('strengths'):
             st.subheader("💪 Strengths")
-            for strength in ai_analysis['strengths']:
-                st.write(f"✅ {strength}")
-
-        # Save analysis to history
-        analysis_result = {
-            'timestamp': st.session_state.get('analysis_timestamp', ''),
-            'overall_score': overall_score,
-            'component_scores': component_scores,
-            'issues_count': len(all_issues),
-            'recommendations_count': len(all_recommendations)
-        }
-
-        if 'analysis_history' not in st.session_state:
-            st.session_state['analysis_history'] = []
-
-        st.session_state['analysis_history'].append(analysis_result)
+            st.markdown("  \n".join(
+                f"✅ {strength}" for strength in ai_analysis['strengths']
+            ))
 
         # Export options
         st.markdown("---")
@@ -447,23 +311,13 @@ def main():
             if st.button("📝 Improve Resume"):
                 st.switch_page("pages/4_📝_Resume_Builder.py")
 
-        # JSON Export
-        export_data = {
-            'overall_score': overall_score,
-            'component_scores': component_scores,
-            'issues': all_issues,
-            'recommendations': all_recommendations,
-            'keywords_found': keyword_analysis.get('keywords_found', []),
-            'ai_analysis': ai_analysis
-        }
-
-        if st.button("💾 Export Analysis (JSON)"):
-            st.download_button(
-                label="Download Analysis",
-                data=json.dumps(export_data, indent=2),
-                file_name=f"ats_analysis_{overall_score}.json",
-                mime="application/json"
-            )
+        # JSON Export (serialized once per analysis)
+        st.download_button(
+            label="💾 Export Analysis (JSON)",
+            data=results['export_json'],
+            file_name=f"ats_analysis_{overall_score}.json",
+            mime="application/json"
+        )
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,264 @@
+"""
+ATS Checker Module
+Rule-based ATS compatibility analysis shared by the ATS Score Checker page.
+"""
+
+import sys
+import re
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+
+# Standard resume sections and the keywords that indicate them
+REQUIRED_SECTIONS = [
+    ('contact', ['email', 'phone', 'address']),
+    ('experience', ['experience', 'work', 'employment', 'professional']),
+    ('education', ['education', 'degree', 'university', 'college']),
+    ('skills', ['skills', 'technical', 'competencies'])
+]
+
+# Common professional keywords
+PROFESSIONAL_KEYWORDS = [
+    'managed', 'developed', 'created', 'implemented', 'improved',
+    'increased', 'reduced', 'achieved', 'delivered', 'coordinated',
+    'led', 'supervised', 'analyzed', 'designed', 'optimized'
+]
+
+BULLET_INDICATORS = ['•', '★', '-', '*', '◦']
+
+# One zero-width lookahead alternation finds every keyword occurrence
+# (including overlapping ones, like `in` substring checks) in a single scan
+_ALL_KEYWORDS = sorted(
+    {kw for _, keywords in REQUIRED_SECTIONS for kw in keywords}
+    | set(PROFESSIONAL_KEYWORDS) | set(BULLET_INDICATORS),
+    key=len, reverse=True
+)
+_KEYWORD_PATTERN = re.compile('(?=(' + '|'.join(map(re.escape, _ALL_KEYWORDS)) + '))')
+
+# Quantified achievements: percentages, dollar amounts, "N+" and durations
+_QTY_RE = re.compile(r'\b\d+%|\$\d+|\d+\+|\d+ years?|\d+ months?')
+
+@lru_cache(maxsize=8)
+def _tokenset(text: str) -> frozenset:
+    """Lower-cased, interned token set of a text, cached across reruns."""
+    return frozenset(sys.intern(word) for word in text.lower().split())
+
+def _apply_checks(checks: List[tuple]) -> Dict[str, Any]:
+    """
+    Score a list of (failed, penalty, issue, recommendation) checks.
+
+    Args:
+        checks: Check tuples; every failed check deducts its penalty from 100
+
+    Returns:
+        Dictionary with the clamped score, issues and recommendations
+    """
+    failed = [check for check in checks if check[0]]
+
+    return {
+        'score': max(0, 100 - sum(penalty for _, penalty, _, _ in failed)),
+        'issues': [issue for _, _, issue, _ in failed],
+        'recommendations': [recommendation for _, _, _, recommendation in failed]
+    }
+
+# Contact fields checked in basic_info, with their penalty when missing
+CONTACT_CHECKS = [
+    ('emails', 40, "No email address found", "Include a professional email address"),
+    ('phones', 30, "No phone number found", "Include a valid phone number"),
+    ('name_candidates', 30, "Name not clearly identified",
+     "Ensure your full name is prominently displayed")
+]
+
+# Contact analysis for every combination of present fields, indexed by contact_flags()
+_CONTACT_RESULTS = [
+    _apply_checks([
+        (not flags & (1 << bit), penalty, issue, recommendation)
+        for bit, (_, penalty, issue, recommendation) in enumerate(CONTACT_CHECKS)
+    ])
+    for flags in range(1 << len(CONTACT_CHECKS))
+]
+
+def contact_flags(basic_info: Dict) -> int:
+    """Pack which CONTACT_CHECKS fields are present in basic_info into a bit mask."""
+    flags = 0
+    for bit, (field, _, _, _) in enumerate(CONTACT_CHECKS):
+        if basic_info.get(field):
+            flags |= 1 << bit
+    return flags
+
+class ATSChecker:
+    """ATS compatibility checker with rule-based and AI-powered analysis."""
+
+    def __init__(self):
+        self.scoring_weights = {
+            'format_compatibility': 20,
+            'content_structure': 25,
+            'keyword_optimization': 20,
+            'readability': 15,
+            'contact_information': 10,
+            'professional_sections': 10
+        }
+
+    def compute_text_stats(self, text: str) -> Dict[str, Any]:
+        """
+        Compute the text statistics shared by all analyzers in one pass each,
+        so the individual checks read them instead of re-walking the resume.
+        """
+        lower = text.lower()
+        words = lower.split()
+
+        # Character-class counts are vectorized over the UTF-8 bytes
+        buffer = np.frombuffer(text.encode('utf-8', 'surrogatepass'), dtype=np.uint8)
+        # Every non-ASCII character has exactly one UTF-8 lead byte (>= 0xC0)
+        nonascii = int(np.count_nonzero(buffer >= 0xC0))
+        if nonascii:
+            # Unicode upper-case letters need str.isupper for exact results
+            upper = sum(map(str.isupper, text))
+        else:
+            upper = int(np.count_nonzero((buffer >= 0x41) & (buffer <= 0x5A)))
+
+        return {
+            'length': len(text),
+            'stripped_length': len(text.strip()),
+            'lower': lower,
+            'words': words,
+            'word_set': frozenset(words),
+            'word_count': len(words),
+            # Splitting on '.' then on whitespace yields the same words as
+            # treating '.' as whitespace, so no per-sentence lists are built
+            'sentence_count': text.count('.') + 1,
+            'sentence_words': len(text.replace('.', ' ').split()),
+            'buffer': buffer,
+            'nonascii': nonascii,
+            'upper': upper,
+            'keywords': frozenset(match.group(1) for match in _KEYWORD_PATTERN.finditer(lower)),
+            'quantified_count': len(_QTY_RE.findall(text))
+        }
+
+    def analyze_format_compatibility(self, text: str, metadata: Dict,
+                                     stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Analyze format compatibility for ATS systems."""
+        stats = stats or self.compute_text_stats(text)
+        file_type = metadata.get('file_type', '').lower()
+
+        return _apply_checks([
+            # Text extraction quality
+            (not text or stats['stripped_length'] < 100, 30,
+             "Poor text extraction - file may have formatting issues",
+             "Convert to a text-based PDF or DOCX format"),
+            # File type
+            (file_type not in ['pdf', 'docx'], 20,
+             f"File format ({file_type}) may not be ATS-friendly",
+             "Use PDF or DOCX format for better ATS compatibility"),
+            # More than 5% special characters
+            (stats['nonascii'] > stats['length'] * 0.05, 15,
+             "High number of special characters detected",
+             "Remove or replace special characters and symbols")
+        ])
+
+    def analyze_content_structure(self, text: str,
+                                  stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Analyze content structure and organization."""
+        stats = stats or self.compute_text_stats(text)
+
+        # Check for standard resume sections
+        keywords_present = stats['keywords']
+        missing_sections = [
+            section_name for section_name, keywords in REQUIRED_SECTIONS
+            if keywords_present.isdisjoint(keywords)
+        ]
+        checks = [
+            (True, 15, f"Missing {section_name} section",
+             f"Add a clear {section_name.title()} section")
+            for section_name in missing_sections
+        ]
+
+        # Check text length
+        word_count = stats['word_count']
+        checks.append((word_count < 200, 20, "Resume content too brief",
+                       "Expand resume content to 300-800 words"))
+        checks.append((word_count > 1000, 10, "Resume content too lengthy",
+                       "Condense content to focus on most relevant information"))
+
+        result = _apply_checks(checks)
+        result['missing_sections'] = missing_sections
+        return result
+
+    def analyze_keyword_optimization(self, text: str, job_description: str = "",
+                                     stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Analyze keyword optimization and density."""
+        stats = stats or self.compute_text_stats(text)
+
+        keywords_present = stats['keywords']
+        found_keywords = [kw for kw in PROFESSIONAL_KEYWORDS if kw in keywords_present]
+
+        checks = [
+            (len(found_keywords) < 5, 25,
+             "Insufficient action verbs and professional keywords",
+             "Include more action verbs and industry-specific keywords"),
+            # Quantified achievements
+            (stats['quantified_count'] < 3, 20,
+             "Few quantified achievements found",
+             "Add specific numbers, percentages, and metrics to achievements")
+        ]
+
+        # Job description matching (if provided)
+        if job_description:
+            jd_words = _tokenset(job_description)
+            common_words = jd_words & stats['word_set']
+            match_ratio = len(common_words) / len(jd_words) if jd_words else 0
+
+            checks.append((match_ratio < 0.3, 15,
+                           "Low keyword match with job description",
+                           "Tailor resume keywords to match job requirements"))
+
+        result = _apply_checks(checks)
+        result['keywords_found'] = found_keywords[:10]  # Return top 10
+        return result
+
+    def analyze_readability(self, text: str,
+                            stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Analyze text readability and formatting."""
+        stats = stats or self.compute_text_stats(text)
+
+        avg_sentence_length = stats['sentence_words'] / stats['sentence_count']
+        caps_ratio = stats['upper'] / stats['length'] if text else 0
+
+        return _apply_checks([
+            # Sentence length
+            (avg_sentence_length > 25, 15,
+             "Sentences too long for ATS parsing",
+             "Use shorter, clearer sentences (15-20 words)"),
+            # Bullet points or structured formatting
+            (stats['keywords'].isdisjoint(BULLET_INDICATORS), 10,
+             "No bullet points detected",
+             "Use bullet points to structure information clearly"),
+            # Excessive capitalization
+            (caps_ratio > 0.15, 15,
+             "Excessive use of capital letters",
+             "Use proper capitalization (title case for headers)")
+        ])
+
+    def analyze_contact_information(self, basic_info: Dict) -> Dict[str, Any]:
+        """Analyze contact information completeness."""
+        result = _CONTACT_RESULTS[contact_flags(basic_info)]
+
+        # Fresh lists, so callers never mutate the shared table
+        return {
+            'score': result['score'],
+            'issues': list(result['issues']),
+            'recommendations': list(result['recommendations'])
+        }
+
+    def calculate_overall_score(self, component_scores: Dict[str, int]) -> int:
+        """Calculate weighted overall ATS score."""
+        count = len(component_scores)
+        scores = np.fromiter(component_scores.values(), dtype=np.float64, count=count)
+        weights = np.fromiter(
+            (self.scoring_weights.get(component, 10) for component in component_scores),
+            dtype=np.float64, count=count
+        )
+
+        # Weighted mean over the components that were actually scored
+        total_weight = weights.sum()
+        return int(scores @ weights / total_weight) if total_weight > 0 else 0
@@ -9,11 +9,51 @@ import pdfplumber
 import docx
 from typing import Optional, Dict, Any, Tuple
 import re
+import os
 import logging
+import mimetypes
+import tempfile
+import shutil
+import atexit
+import threading
 from io import BytesIO
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Private (0700) per-process directory for uploads while they are parsed
+_upload_dir: Optional[str] = None
+_upload_dir_lock = threading.Lock()
+
+# Contact-info patterns, compiled once at import
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERNS = [
+    re.compile(r'\b(?:\+?1[-\s]?)?\(?[0-9]{3}\)?[-\s]?[0-9]{3}[-\s]?[0-9]{4}\b'),
+    re.compile(r'\b[0-9]{3}[-\.]?[0-9]{3}[-\.]?[0-9]{4}\b'),
+    re.compile(r'\b\([0-9]{3}\)\s?[0-9]{3}[-\s]?[0-9]{4}\b')
+]
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+NAME_PATTERN = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}\b')
+
+# Text-cleaning patterns
+WHITESPACE_PATTERN = re.compile(r'\s+')
+CONTROL_CHAR_PATTERN = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\xff]')
+
+class StoredUpload:
+    """
+    Stand-in for Streamlit's UploadedFile backed by a file on disk.
+    Exposes `path` so PDF/DOCX libraries can read the file directly.
+    """
+
+    def __init__(self, path: str, filename: str):
+        self.path = path
+        self.name = filename
+        self.size = os.path.getsize(path)
+        self.type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    def getvalue(self) -> bytes:
+        return Path(self.path).read_bytes()
+
 class ResumeParser:
     """
     A comprehensive resume parser that handles multiple file formats
@@ -81,12 +121,17 @@ class ResumeParser:
             st.error(f"❌ Error processing file: {str(e)}")
             return None, None
 
+    def _file_source(self, uploaded_file):
+        """Return the on-disk path when available, otherwise an in-memory buffer."""
+        path = getattr(uploaded_file, 'path', None)
+        return path if path else BytesIO(uploaded_file.getvalue())
+
     def _parse_pdf(self, uploaded_file) -> Optional[str]:
         """Extract text from PDF file using pdfplumber."""
         try:
             text_content = ""
 
-            with pdfplumber.open(BytesIO(uploaded_file.getvalue())) as pdf:
+            with pdfplumber.open(self._file_source(uploaded_file)) as pdf:
                 for page_num, page in enumerate(pdf.pages):
                     try:
                         page_text = page.extract_text()
@@ -109,7 +154,7 @@ class ResumeParser:
     def _parse_docx(self, uploaded_file) -> Optional[str]:
         """Extract text from DOCX file using python-docx."""
         try:
-            doc = docx.Document(BytesIO(uploaded_file.getvalue()))
+            doc = docx.Document(self._file_source(uploaded_file))
             text_content = ""
 
             # Extract text from paragraphs
@@ -158,24 +203,27 @@ class ResumeParser:
         if not text:
             return ""
 
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Remove excessive whitespace (this also folds every line break,
+        # so no separate newline pass is needed)
+        text = WHITESPACE_PATTERN.sub(' ', text)
 
         # Remove special characters that might interfere with processing
-        text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\xff]', '', text)
-
-        # Normalize line breaks
-        text = re.sub(r'\n+', '\n', text)
+        text = CONTROL_CHAR_PATTERN.sub('', text)
 
         # Remove leading/trailing whitespace
         text = text.strip()
 
         return text
 
-    def extract_basic_info(self, text: str) -> Dict[str, Any]:
+    def extract_basic_info(self, text: str, quick: bool = False) -> Dict[str, Any]:
         """
         Extract basic information from resume text using regex patterns.
         This is a fallback method when AI analysis is not available.
+
+        Args:
+            text: Resume text content
+            quick: Stop at the first email, phone and name match instead of
+                collecting every match (enough for summary displays)
         """
         info = {
             'emails': [],
@@ -187,33 +235,43 @@ class ResumeParser:
         if not text:
             return info
 
+        # URL extraction (all matches, the count is displayed)
+        info['urls'] = list(set(URL_PATTERN.findall(text)))
+
+        # Name candidates (first few lines, capitalized words)
+        lines = text.split('\n')[:5]  # Check first 5 lines
+
+        if quick:
+            email_match = EMAIL_PATTERN.search(text)
+            if email_match:
+                info['emails'] = [email_match.group()]
+
+            for pattern in PHONE_PATTERNS:
+                phone_match = pattern.search(text)
+                if phone_match:
+                    info['phones'] = [phone_match.group()]
+                    break
+
+            for line in lines:
+                name_match = NAME_PATTERN.search(line.strip())
+                if name_match:
+                    info['name_candidates'] = [name_match.group()]
+                    break
+
+            return info
+
         # Email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        info['emails'] = list(set(re.findall(email_pattern, text)))
+        info['emails'] = list(set(EMAIL_PATTERN.findall(text)))
 
         # Phone number extraction (various formats)
-        phone_patterns = [
-            r'\b(?:\+?1[-\s]?)?\(?[0-9]{3}\)?[-\s]?[0-9]{3}[-\s]?[0-9]{4}\b',
-            r'\b[0-9]{3}[-\.]?[0-9]{3}[-\.]?[0-9]{4}\b',
-            r'\b\([0-9]{3}\)\s?[0-9]{3}[-\s]?[0-9]{4}\b'
-        ]
-
         phones = []
-        for pattern in phone_patterns:
-            phones.extend(re.findall(pattern, text))
+        for pattern in PHONE_PATTERNS:
+            phones.extend(pattern.findall(text))
         info['phones'] = list(set(phones))
 
-        # URL extraction
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        info['urls'] = list(set(re.findall(url_pattern, text)))
-
-        # Name candidates (first few lines, capitalized words)
-        lines = text.split('\n')[:5]  # Check first 5 lines
         for line in lines:
             # Look for properly capitalized names (2-4 words, each capitalized)
-            name_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3}\b'
-            matches = re.findall(name_pattern, line.strip())
-            info['name_candidates'].extend(matches)
+            info['name_candidates'].extend(NAME_PATTERN.findall(line.strip()))
 
         # Remove duplicates and sort
         info['name_candidates'] = list(set(info['name_candidates']))
@@ -257,18 +315,22 @@ class ResumeParser:
             'extension': uploaded_file.name.split('.')[-1].lower() if '.' in uploaded_file.name else 'unknown'
         }
 
+# Shared parser instance; the parser is stateless, so one serves every call
+_parser = ResumeParser()
+
 # Utility function for easy import
-def parse_uploaded_resume(uploaded_file):
+def parse_uploaded_resume(uploaded_file, *, quick: bool = False):
     """
     Convenience function to parse an uploaded resume file.
 
     Args:
         uploaded_file: Streamlit uploaded file object
+        quick: Only keep the first email, phone and name match in basic_info
 
     Returns:
         Tuple of (text_content, metadata, basic_info)
     """
-    parser = ResumeParser()
+    parser = _parser
 
     # Validate file first
     is_valid, error_msg = parser.validate_file(uploaded_file)
@@ -281,7 +343,65 @@ def parse_uploaded_resume(uploaded_file):
 
     if text_content:
         # Extract basic info as fallback
-        basic_info = parser.extract_basic_info(text_content)
+        basic_info = parser.extract_basic_info(text_content, quick=quick)
         return text_content, metadata, basic_info
 
     return None, None, None
+
+def parse_uploaded_resume_from_path(path: str, filename: str, *, quick: bool = False):
+    """
+    Parse a resume previously persisted with `store_upload`.
+
+    Args:
+        path: Location of the stored file
+        filename: Original filename, used to detect the file format
+        quick: Only keep the first email, phone and name match in basic_info
+
+    Returns:
+        Tuple of (text_content, metadata, basic_info)
+    """
+    return parse_uploaded_resume(StoredUpload(path, filename), quick=quick)
+
+def validate_upload(uploaded_file) -> Tuple[bool, str]:
+    """
+    Validate an uploaded file before it is stored or parsed.
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    return _parser.validate_file(uploaded_file)
+
+def _get_upload_dir() -> str:
+    """Create the private upload directory on first use; it is removed at exit."""
+    global _upload_dir
+    with _upload_dir_lock:
+        if _upload_dir is None:
+            _upload_dir = tempfile.mkdtemp(prefix='resume_analyzer_')
+            atexit.register(shutil.rmtree, _upload_dir, ignore_errors=True)
+    return _upload_dir
+
+def store_upload(file_bytes, filename: str) -> str:
+    """
+    Persist uploaded bytes to a private temp file for parsing.
+    Every call gets its own file (mode 0600), so concurrent sessions never
+    read each other's partially written copies. Remove it with `discard_upload`.
+
+    Args:
+        file_bytes: Raw content of the uploaded file (bytes or memoryview)
+        filename: Original filename, used for the file extension
+
+    Returns:
+        Path of the stored file
+    """
+    extension = filename.split('.')[-1].lower()
+    fd, path = tempfile.mkstemp(suffix=f".{extension}", dir=_get_upload_dir())
+    with os.fdopen(fd, 'wb') as stored:
+        stored.write(file_bytes)
+    return path
+
+def discard_upload(path: str) -> None:
+    """Delete a file written by `store_upload`."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -4,15 +4,13 @@ Provides reusable, styled Streamlit components with consistent theming.
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
 from typing import Dict, Any, List, Optional
-import base64
+import bisect
+import copy
+from collections import deque
 from datetime import datetime
 
-def load_custom_css():
-    """Load custom CSS for enhanced UI styling."""
-    css = """
+_CUSTOM_CSS = """
     <style>
     /* Import Google Fonts */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
@@ -38,6 +36,23 @@ def load_custom_css():
         box-shadow: 0 8px 15px rgba(0, 0, 0, 0.2);
     }
 
+    .feature-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 0 1rem;
+    }
+
+    .app-footer {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+        font-size: 0.875rem;
+        line-height: 1.6;
+        /* Muted theme text colour, like st.caption */
+        color: inherit;
+        opacity: 0.6;
+    }
+
     .score-badge {
         display: inline-block;
         padding: 0.5rem 1rem;
@@ -151,6 +166,10 @@ def load_custom_css():
 
     /* Responsive Design */
     @media (max-width: 768px) {
+        .feature-grid {
+            grid-template-columns: 1fr;
+        }
+
         .feature-card {
             padding: 1rem;
             margin: 0.5rem 0;
@@ -162,28 +181,50 @@ def load_custom_css():
     }
     </style>
     """
-    st.markdown(css, unsafe_allow_html=True)
+
+# The style block is re-sent on every rerun, so strip its indentation and
+# blank lines once at import to keep that payload small
+_CUSTOM_CSS = "\n".join(line.strip() for line in _CUSTOM_CSS.splitlines() if line.strip())
+
+def load_custom_css():
+    """Load custom CSS for enhanced UI styling."""
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+def feature_card_html(title: str, description: str, icon: str = "⭐") -> str:
+    """Build the HTML for a styled feature card."""
+    return (
+        f'<div class="feature-card fade-in">'
+        f'<h3>{icon} {title}</h3>'
+        f'<p>{description}</p>'
+        f'</div>'
+    )
 
 def create_feature_card(title: str, description: str, icon: str = "⭐") -> None:
     """Create a styled feature card."""
-    card_html = f"""
-    <div class="feature-card fade-in">
-        <h3>{icon} {title}</h3>
-        <p>{description}</p>
-    </div>
+    st.markdown(feature_card_html(title, description, icon), unsafe_allow_html=True)
+
+# Lower bounds of the average, good and excellent score bands
+SCORE_THRESHOLDS = (50, 70, 85)
+
+# Per-band styling, ordered poor, average, good, excellent
+SCORE_BADGE_CLASSES = ("score-poor", "score-average", "score-good", "score-excellent")
+SCORE_COLORS = ('#dc3545', '#ffc107', '#17a2b8', '#28a745')
+
+def score_band(score: float) -> int:
     """
-    st.markdown(card_html, unsafe_allow_html=True)
+    Return the band index of a score.
+
+    Args:
+        score: Score on a 0-100 scale
+
+    Returns:
+        0 for poor, 1 for average, 2 for good and 3 for excellent
+    """
+    return bisect.bisect_right(SCORE_THRESHOLDS, score)
 
 def create_score_badge(score: float, label: str = "Score") -> None:
     """Create a styled score badge with color coding."""
-    if score >= 85:
-        css_class = "score-excellent"
-    elif score >= 70:
-        css_class = "score-good"
-    elif score >= 50:
-        css_class = "score-average"
-    else:
-        css_class = "score-poor"
+    css_class = SCORE_BADGE_CLASSES[score_band(score)]
 
     badge_html = f"""
     <div class="score-badge {css_class}">
@@ -207,19 +248,30 @@ def create_alert(message: str, alert_type: str = "info") -> None:
     """
     st.markdown(alert_html, unsafe_allow_html=True)
 
-def create_progress_bar(value: float, max_value: float = 100, 
-                       label: str = "", color: str = "#667eea") -> None:
-    """Create an animated progress bar."""
+def progress_bar_html(value: float, max_value: float = 100,
+                      label: str = "", color: str = "#667eea") -> str:
+    """Build the HTML for an animated progress bar."""
     percentage = (value / max_value) * 100
 
-    progress_html = f"""
+    return f"""
     <div class="progress-container">
         <div class="progress-bar" style="width: {percentage}%; background: {color};">
             {label} {percentage:.0f}%
         </div>
     </div>
     """
-    st.markdown(progress_html, unsafe_allow_html=True)
+
+def create_progress_bar(value: float, max_value: float = 100, 
+                       label: str = "", color: str = "#667eea") -> None:
+    """Create an animated progress bar."""
+    st.markdown(progress_bar_html(value, max_value, label, color), unsafe_allow_html=True)
+
+def create_progress_bars(bars: Dict[str, float], max_value: float = 100) -> None:
+    """Create a group of progress bars, keyed by label, in a single element."""
+    bars_html = "".join(
+        progress_bar_html(value, max_value, label) for label, value in bars.items()
+    )
+    st.markdown(bars_html, unsafe_allow_html=True)
 
 def create_metric_card(title: str, value: str, delta: str = "", 
                       delta_color: str = "normal") -> None:
@@ -245,13 +297,15 @@ def create_recommendation_list(recommendations: List[str],
     """Create a styled list of recommendations."""
     st.subheader(title)
 
-    for i, recommendation in enumerate(recommendations, 1):
-        rec_html = f"""
+    list_html = "".join(
+        f"""
         <div class="recommendation-item fade-in">
             <strong>{i}.</strong> {recommendation}
         </div>
         """
-        st.markdown(rec_html, unsafe_allow_html=True)
+        for i, recommendation in enumerate(recommendations, 1)
+    )
+    st.markdown(list_html, unsafe_allow_html=True)
 
 def create_two_column_layout(left_content, right_content):
     """Create a responsive two-column layout."""
@@ -293,6 +347,8 @@ def display_file_info(file_info: Dict[str, Any]) -> None:
 
 def create_radar_chart(data: Dict[str, float], title: str = "Skills Assessment"):
     """Create a radar chart for skills or scores visualization."""
+    import plotly.graph_objects as go
+
     categories = list(data.keys())
     values = list(data.values())
 
@@ -322,20 +378,13 @@ def create_radar_chart(data: Dict[str, float], title: str = "Skills Assessment")
 
 def create_score_distribution_chart(scores: Dict[str, float]):
     """Create a horizontal bar chart for score distribution."""
+    import plotly.graph_objects as go
+
     categories = list(scores.keys())
     values = list(scores.values())
 
     # Color code based on score ranges
-    colors = []
-    for score in values:
-        if score >= 85:
-            colors.append('#28a745')  # Green
-        elif score >= 70:
-            colors.append('#17a2b8')  # Blue
-        elif score >= 50:
-            colors.append('#ffc107')  # Yellow
-        else:
-            colors.append('#dc3545')  # Red
+    colors = [SCORE_COLORS[score_band(score)] for score in values]
 
     fig = go.Figure(go.Bar(
         x=values,
@@ -361,6 +410,8 @@ def create_timeline_chart(data: List[Dict], title: str = "Career Timeline"):
     if not data:
         return None
 
+    import plotly.graph_objects as go
+
     dates = [item.get('date', '') for item in data]
     events = [item.get('event', '') for item in data]
     descriptions = [item.get('description', '') for item in data]
@@ -392,11 +443,10 @@ def show_loading_spinner(message: str = "Processing..."):
     """Show a loading spinner with custom message."""
     return st.spinner(f"🔄 {message}")
 
-def create_download_button(data: str, filename: str, label: str = "Download"):
-    """Create a styled download button."""
-    b64 = base64.b64encode(data.encode()).decode()
-    href = f'<a href="data:text/plain;base64,{b64}" download="{filename}">{label}</a>'
-    st.markdown(href, unsafe_allow_html=True)
+def create_download_button(data: str, filename: str, label: str = "Download",
+                           mime: str = "text/plain"):
+    """Create a download button served by Streamlit rather than an inline data URI."""
+    st.download_button(label=label, data=data, file_name=filename, mime=mime)
 
 def display_success_message(message: str):
     """Display a success message with animation."""
@@ -440,31 +490,42 @@ def create_sidebar_navigation():
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
     st.sidebar.caption(f"Last updated: {current_time}")
 
-def initialize_session_state():
-    """Initialize session state variables for the application."""
-    default_values = {
-        'analyzed_resumes': [],
-        'analysis_history': [],
-        'current_resume_text': None,
-        'current_resume_data': None,
-        'user_feedback': [],
-        'app_settings': {
-            'theme': 'default',
-            'ai_enabled': True,
-            'advanced_features': True
-        }
+# Maximum number of analysis records kept per session
+ANALYSIS_HISTORY_SIZE = 100
+
+# Default session state; values are deep-copied so sessions never share them
+_SESSION_DEFAULTS = {
+    'analyzed_resumes': [],
+    'analysis_history': deque(maxlen=ANALYSIS_HISTORY_SIZE),
+    'current_resume_text': None,
+    'current_resume_data': None,
+    'user_feedback': [],
+    'app_settings': {
+        'theme': 'default',
+        'ai_enabled': True,
+        'advanced_features': True
     }
+}
+
+def initialize_session_state():
+    """Initialize session state variables for the application (once per session)."""
+    if st.session_state.get('_session_initialized'):
+        return
 
-    for key, value in default_values.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+    st.session_state.update({
+        key: copy.deepcopy(value)
+        for key, value in _SESSION_DEFAULTS.items()
+        if key not in st.session_state
+    })
+    st.session_state['_session_initialized'] = True
 
 def clear_session_data():
     """Clear session data with user confirmation."""
     if st.button("🗑️ Clear All Data", type="secondary"):
         if st.checkbox("I confirm I want to clear all data"):
-            for key in st.session_state.keys():
+            for key in list(st.session_state.keys()):
                 if key.startswith(('analyzed_', 'current_', 'user_')):
                     del st.session_state[key]
+            st.session_state.pop('_session_initialized', None)
             st.success("✅ All data cleared successfully!")
             st.rerun()